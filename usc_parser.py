@@ -29,11 +29,20 @@ Usage from command line:
 try:
     from lxml import etree as ET
 except ImportError:
-    import xml.etree.ElementTree as ET
-    print("Warning: lxml not available, hierarchy extraction will be limited")
+    raise ImportError(
+        "lxml is required: the stdlib ElementTree fallback lacks getparent() "
+        "and cannot extract hierarchy. Install it with: pip install lxml"
+    )
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import os
+import sys
 import json
 import re
+import mmap
+import pickle
 import hashlib
 import zipfile
 import urllib.request
@@ -41,7 +50,7 @@ import socket
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from collections import defaultdict, Counter
 
 
 NAMESPACE = {
@@ -52,6 +61,11 @@ NAMESPACE = {
 USC_XML_URL = "https://uscode.house.gov/download/releasepoints/us/pl/119/12/xml_uscAll@119-12.zip"
 DEFAULT_XML_DIR = "xml_uscAll@119-12"
 
+# Stamped once per process: the values are identical for every law in a
+# run, and gethostname() is a syscall we should not pay per section
+PROCESSING_MACHINE = socket.gethostname()
+PROCESSING_TIMESTAMP = time.time()
+
 # Define hierarchical structural elements that should be part of the path
 HIERARCHICAL_TAGS = {
     'title', 'subtitle', 'part', 'subpart', 'division', 'subdivision',
@@ -60,6 +74,152 @@ HIERARCHICAL_TAGS = {
     'item', 'subitem'
 }
 
+# Simple text-bearing tags handled identically by the default content
+# extraction; elements whose children are all of these take a fast path
+SIMPLE_CONTENT_TAGS = {'num', 'heading', 'p', 'chapeau', 'content', 'continuation'}
+
+# Regexes fired per section, compiled once at module load
+RE_USC_HREF = re.compile(r'/us/usc/t(\d+[A-Za-z]*)/([sc])(\d+[A-Za-z]*)')
+RE_ACT_HREF = re.compile(r'/us/act/([^/]+)/(.+)')
+RE_PL_HREF = re.compile(r'/us/pl/(\d+)/(\d+)')
+RE_STAT_HREF = re.compile(r'/us/stat/(\d+[A-Za-z]*)/(\d+)')
+RE_PL_PATH = re.compile(r'/pl/(\d+)/(\d+)')
+RE_AMENDMENT_YEAR = re.compile(r'^(\d{4})—')
+RE_PL_LABEL = re.compile(r'Pub\. L\. ([\d–-]+)')
+RE_STAT_LABEL = re.compile(r'(\d+\s+Stat\.\s+\d+)')
+RE_FED_REGISTER = re.compile(r'\d+ F\.R\. [\d,\s]+')
+# Alternation of the three fixed-shape citation patterns (Public Law,
+# Statutes at Large, Executive Order), so note text is scanned once
+# instead of three times. The F.R. pattern stays separate: its greedy
+# [\d,\s]+ tail could swallow the leading digits of a Stat. citation
+# that follows it in the same note
+RE_NOTE_SCAN = re.compile(
+    r'(?P<pl>Pub\. L\. \d+[-–]\d+)'
+    r'|(?P<stat>\d+ Stat\. \d+)'
+    r'|(?P<eo>(?:Ex\. Ord\. No\.|Executive Order) \d+)'
+)
+RE_TITLE_FILE = re.compile(r'^usc(\d+)[A-Za-z]?\.xml$')
+
+# Clark-notation tags for immediate-child lookups; direct iteration with
+# tag equality is faster than invoking the XPath engine in hot loops
+NUM_TAG = '{%s}num' % NAMESPACE['uslm']
+HEADING_TAG = '{%s}heading' % NAMESPACE['uslm']
+SECTION_TAG = '{%s}section' % NAMESPACE['uslm']
+REF_TAG = '{%s}ref' % NAMESPACE['uslm']
+SOURCE_CREDIT_TAG = '{%s}sourceCredit' % NAMESPACE['uslm']
+NOTES_TAG = '{%s}notes' % NAMESPACE['uslm']
+DATE_TAG = '{%s}date' % NAMESPACE['uslm']
+
+# Fully-qualified versions of HIERARCHICAL_TAGS so ancestor walks can test
+# element tags directly without stripping the namespace each iteration
+HIERARCHICAL_CLARK_TAGS = {'{%s}%s' % (NAMESPACE['uslm'], tag) for tag in HIERARCHICAL_TAGS}
+
+# Single parser instance shared across all titles; collect_ids=False skips
+# lxml's id->element hashtable and resolve_entities=False avoids entity
+# expansion work we never need
+XML_PARSER = ET.XMLParser(huge_tree=True, collect_ids=False, resolve_entities=False)
+
+
+def compile_xpath(expr: str):
+    """
+    Compile an XPath expression once at module load.
+
+    Returns an ET.XPath callable, so no per-call expression parsing.
+    """
+    return ET.XPath(expr, namespaces=NAMESPACE)
+
+
+def find_first(results):
+    """Return the first element of a compiled-XPath result list, or None."""
+    return results[0] if results else None
+
+
+# Compiled XPath expressions used in per-section hot paths
+XP_SOURCE_CREDIT = compile_xpath('.//uslm:sourceCredit')
+XP_REF = compile_xpath('.//uslm:ref')
+XP_NOTES = compile_xpath('.//uslm:notes')
+XP_AMEND_NOTES = compile_xpath('.//uslm:note[@topic="amendments"]')
+XP_P = compile_xpath('.//uslm:p')
+XP_TOC_HEADER = compile_xpath('.//uslm:header[@role="tocColumnHeader"]')
+XP_TOC_ITEM = compile_xpath('.//uslm:tocItem')
+XP_COL_LEFT = compile_xpath('./uslm:column[@class="twoColumnLeft"]')
+XP_COL_RIGHT = compile_xpath('./uslm:column[@class="twoColumnRight"]')
+
+
+class ElementData:
+    """
+    Lightweight per-element record produced by the traversal.
+
+    Uses __slots__ to avoid per-instance dict overhead; one of these is
+    created for every element visited, so the savings add up on large titles.
+    """
+    __slots__ = ('xml_element', 'element_info', 'ancestor_path', 'ancestors_joined')
+
+    def __init__(self, xml_element, element_info, ancestor_path, ancestors_joined=''):
+        self.xml_element = xml_element
+        self.element_info = element_info
+        self.ancestor_path = ancestor_path
+        self.ancestors_joined = ancestors_joined
+
+
+def calculate_text_hash(text: str) -> str:
+    """
+    Compute a SHA-256 hash of whitespace-normalized, lowercased text.
+
+    Lowercases the whole string once, then hands a single bytes object to
+    the C digest — far cheaper than a Python-level loop feeding the hasher
+    token by token. str.lower() (not bytes.lower()) keeps the digest stable
+    for the occasional non-ASCII character in USC text.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        Hex digest string for change detection
+    """
+    normalized = ' '.join(text.lower().split())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+_LOCALNAME_CACHE: Dict[str, str] = {}
+
+
+def local_name(tag: str) -> str:
+    """
+    Strip the Clark-notation namespace from a tag name, memoized.
+
+    lxml interns tag strings, so after the first sight of each distinct
+    tag this is one dict hit instead of a character scan plus split.
+    Results are interned so every consumer shares one object per name.
+    """
+    name = _LOCALNAME_CACHE.get(tag)
+    if name is None:
+        name = _LOCALNAME_CACHE.setdefault(tag, sys.intern(tag.rsplit('}', 1)[-1]))
+    return name
+
+
+def find_num_heading_text(element: ET.Element):
+    """
+    Return the (num text, heading text) of an element's immediate children.
+
+    One walk over the child list instead of a probe per tag; lxml
+    children are a linked list, so every extra probe re-traverses it.
+    """
+    num = heading = None
+    for child in element:
+        tag = child.tag
+        if tag == NUM_TAG:
+            if num is None:
+                num = child.text or ''
+                if heading is not None:
+                    break
+        elif tag == HEADING_TAG:
+            if heading is None:
+                heading = child.text or ''
+                if num is not None:
+                    break
+    return num or '', heading or ''
+
 
 def ensure_xml_data_exists(xml_dir: str = DEFAULT_XML_DIR) -> bool:
     """
@@ -93,24 +253,42 @@ def ensure_xml_data_exists(xml_dir: str = DEFAULT_XML_DIR) -> bool:
     print(f"Downloading USC XML data...")
     
     try:
-        # Download with progress indicator
-        def download_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(100, (downloaded / total_size) * 100)
-            print(f"\rProgress: {percent:.1f}%", end='', flush=True)
-        
-        urllib.request.urlretrieve(USC_XML_URL, zip_filename, reporthook=download_progress)
+        # Stream the download in 1MB chunks with a progress indicator;
+        # large buffers keep syscall count low on the ~250MB archive
+        with urllib.request.urlopen(USC_XML_URL) as response, \
+                open(zip_filename, 'wb') as out:
+            total_size = int(response.headers.get('Content-Length') or 0)
+            downloaded = 0
+            while True:
+                chunk = response.read(1 << 20)
+                if not chunk:
+                    break
+                out.write(chunk)
+                downloaded += len(chunk)
+                if total_size:
+                    percent = min(100, (downloaded / total_size) * 100)
+                    print(f"\rProgress: {percent:.1f}%", end='', flush=True)
         print("\nDownload complete.")
-        
-        # Extract the zip file
+
+        # Extract members in parallel; zipfile supports concurrent reads
+        # and the zlib decompression releases the GIL per member
         print("Extracting XML files...")
+        from concurrent.futures import ThreadPoolExecutor
         with zipfile.ZipFile(zip_filename, 'r') as zip_ref:
-            zip_ref.extractall('.')
-        
+            names = [n for n in zip_ref.namelist() if not n.endswith('/')]
+            # Pre-create directories so the workers never race on makedirs
+            for name in names:
+                dirname = os.path.dirname(name)
+                if dirname:
+                    os.makedirs(dirname, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                # list() re-raises any extraction error from the workers
+                list(pool.map(lambda name: zip_ref.extract(name, '.'), names))
+
         # Clean up zip file
         os.remove(zip_filename)
         print(f"Extraction complete. XML files are now available in '{xml_dir}'.")
-        
+
         return True
         
     except Exception as e:
@@ -136,76 +314,125 @@ def helper_find_all_tags(element: ET.Element, tags_counter: Dict[str, int] = Non
     """
     if tags_counter is None:
         tags_counter = {}
-    
-    # Get tag without namespace
-    tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-    tags_counter[tag] = tags_counter.get(tag, 0) + 1
-    
-    # Recurse through children
-    for child in element:
-        helper_find_all_tags(child, tags_counter)
-    
+
+    # iter() walks the subtree at the C level; no Python frame per node
+    for el in element.iter():
+        tag = el.tag
+        tag = local_name(tag)
+        tags_counter[tag] = tags_counter.get(tag, 0) + 1
+
     return tags_counter
 
 
 
 
+def iter_with_ancestor_paths(xml_element: ET.Element, current_path: List[Dict[str, Any]] = None,
+                             hierarchical_only: bool = False, ancestors_joined: str = ''):
+    """
+    Traverse document lazily, yielding elements with their complete ancestor paths.
+
+    Args:
+        xml_element: XML element to process
+        current_path: Current ancestor path (list of ancestor info)
+        hierarchical_only: If True, skip building element data for
+            non-hierarchical elements entirely
+        ancestors_joined: Pre-joined ancestor string, extended incrementally
+            so each element avoids re-walking its full path
+
+    Yields:
+        Element data dictionaries with ancestor paths
+    """
+    if current_path is None:
+        current_path = []
+
+    # Explicit DFS stack instead of recursion: no Python frame per node and
+    # no recursion-limit risk on deep hierarchies. A None element marks a
+    # deferred yield, so hierarchical elements still surface after their
+    # descendants exactly as the recursive version did
+    stack = [(xml_element, current_path, ancestors_joined)]
+    while stack:
+        xml_element, current_path, ancestors_joined = stack.pop()
+
+        if xml_element is None:
+            # Deferred ElementData for a hierarchical element; its subtree
+            # has been fully processed by now
+            yield current_path
+            continue
+
+        # Test hierarchy on the namespaced tag so the filtered fast path
+        # never pays for the split-based namespace strip. Deliberate
+        # output change: only uslm-namespace elements count as
+        # hierarchical now, so the Dublin Core <dc:title> in each file's
+        # <meta> block no longer produces a junk law record
+        clark_tag = xml_element.tag
+        is_hierarchical = clark_tag in HIERARCHICAL_CLARK_TAGS
+
+        # Non-hierarchical elements can be skipped entirely when filtering;
+        # their children are still traversed with the same ancestor path
+        if hierarchical_only and not is_hierarchical:
+            for child in reversed(xml_element):
+                stack.append((child, current_path, ancestors_joined))
+            continue
+
+        # Get element tag without namespace; local_name() interns, so the
+        # thousands of element_info dicts share one string object per tag
+        tag = local_name(clark_tag)
+
+        # Get basic element info via direct child iteration (hot loop)
+        num, heading = find_num_heading_text(xml_element)
+
+        # Build element info with ALL attributes preserved
+        element_info = {
+            'tag': tag,
+            'num': num,
+            'heading': heading,
+            'attributes': extract_all_element_attributes(xml_element)
+        }
+
+        element_data = ElementData(
+            xml_element=xml_element,
+            element_info=element_info,
+            ancestor_path=current_path,  # Everything above this element
+            ancestors_joined=ancestors_joined
+        )
+
+        if is_hierarchical:
+            new_path = current_path + [element_info]
+
+            # Extend the joined ancestor string once; shared by all descendants
+            identifier = element_info['attributes'].get('identifier', '')
+            if identifier:
+                segment = f"{tag.capitalize()}:{identifier}"
+                new_joined = f"{ancestors_joined}; {segment}" if ancestors_joined else segment
+            else:
+                new_joined = ancestors_joined
+
+            # Children first, then the element itself (pushed deepest so it
+            # pops after its whole subtree)
+            stack.append((None, element_data, None))
+            for child in reversed(xml_element):
+                stack.append((child, new_path, new_joined))
+        else:
+            # Non-hierarchical elements surface before their children
+            yield element_data
+            for child in reversed(xml_element):
+                stack.append((child, current_path, ancestors_joined))
+
+
 def traverse_with_ancestor_paths(xml_element: ET.Element, current_path: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Traverse document and extract ALL elements with their complete ancestor paths.
-    
+
     Args:
         element: XML element to process
         current_path: Current ancestor path (list of ancestor info)
-        
+
     Returns:
         List of all element data with ancestor paths
     """
-    if current_path is None:
-        current_path = []
-    
-    results = []
-    
-    # Get element tag without namespace
-    tag = xml_element.tag.split('}')[-1] if '}' in xml_element.tag else xml_element.tag
-    
-    
-    # Get basic element info
-    num_elem = xml_element.find('./uslm:num', NAMESPACE)
-    num = num_elem.text if num_elem is not None and num_elem.text else ''
-    
-    heading_elem = xml_element.find('./uslm:heading', NAMESPACE)
-    heading = heading_elem.text if heading_elem is not None and heading_elem.text else ''
-    
-    # Build element info with ALL attributes preserved
-    element_info = {
-        'tag': tag,
-        'num': num,
-        'heading': heading,
-        'attributes': extract_all_element_attributes(xml_element)
-    }
-    
-    # If this is a hierarchical element, add it to the path and continue
-    if tag in HIERARCHICAL_TAGS:
-        new_path = current_path + [element_info]
-        
-        # Continue traversing with the extended path
-        for child in xml_element:
-            results.extend(traverse_with_ancestor_paths(child, new_path))
-    
-    # For ALL elements (including hierarchical ones), extract them as content items
-    results.append({
-        'xml_element': xml_element,
-        'element_info': element_info,
-        'ancestor_path': current_path  # Everything above this element
-    })
-    
-    # If not hierarchical, still traverse children
-    if tag not in HIERARCHICAL_TAGS:
-        for child in xml_element:
-            results.extend(traverse_with_ancestor_paths(child, current_path))
-    
-    return results
+    return list(iter_with_ancestor_paths(xml_element, current_path))
+
+
 
 
 
@@ -214,63 +441,87 @@ def traverse_with_ancestor_paths(xml_element: ET.Element, current_path: List[Dic
 
 
 
+def scan_section(xml_element: ET.Element):
+    """
+    Walk a subtree once, collecting the elements the per-section extractors need.
+
+    Fuses the separate descendant scans for refs, sourceCredit and notes so
+    the same nodes are not re-traversed by each extractor.
 
+    Args:
+        xml_element: Element whose subtree to scan
 
-def extract_amendment_history(section: ET.Element) -> List[Dict[str, str]]:
+    Returns:
+        Tuple of (ref elements, first sourceCredit element or None,
+        first notes element or None)
+    """
+    refs = []
+    source_credit = None
+    notes = None
+    for elem in xml_element.iter():
+        tag = elem.tag
+        if tag == REF_TAG:
+            refs.append(elem)
+        elif tag == SOURCE_CREDIT_TAG and source_credit is None:
+            source_credit = elem
+        elif tag == NOTES_TAG and notes is None:
+            notes = elem
+    return refs, source_credit, notes
+
+
+def extract_amendment_history(section: ET.Element, source_credit: ET.Element = None,
+                              notes_section: ET.Element = None) -> List[Dict[str, str]]:
     """
     Extract all amendments with dates and public law references.
-    
+
     Args:
         section: Section element
-        
+        source_credit: Pre-collected sourceCredit element (found if None)
+        notes_section: Pre-collected notes element (found if None)
+
     Returns:
         List of dictionaries with amendment information
     """
     amendments = []
-    
+
     # First, extract all source credit info with dates
     source_dates = {}
-    source_credit = section.find('.//uslm:sourceCredit', NAMESPACE)
+    if source_credit is None:
+        source_credit = find_first(XP_SOURCE_CREDIT(section))
     if source_credit is not None:
-        # Parse the source credit text to match Public Laws with dates
-        source_text = ''.join(source_credit.itertext())
-        
-        # Find all ref elements and following date elements
-        refs = source_credit.findall('.//uslm:ref', NAMESPACE)
-        dates = source_credit.findall('.//uslm:date', NAMESPACE)
-        
-        # Create a map of public law to date
-        for i, ref in enumerate(refs):
-            href = ref.get('href', '')
-            if '/pl/' in href:
-                pl_match = re.search(r'/pl/(\d+)/(\d+)', href)
-                if pl_match:
-                    pl_num = f"{pl_match.group(1)}-{pl_match.group(2)}"
-                    # Find the next date element after this ref
-                    ref_text = ref.text or ''
-                    for date in dates:
-                        date_text = date.text or ''
-                        # Check if this date follows this public law in the text
-                        if pl_num in source_text and date.get('date'):
-                            idx_pl = source_text.find(f"Pub. L. {pl_num}")
-                            idx_date = source_text.find(date_text)
-                            if idx_pl >= 0 and idx_date > idx_pl:
-                                source_dates[pl_num] = date.get('date')
-                                break
+        # Map each public law ref to the first date element that follows it
+        # in document order — a single merge-style pass instead of repeated
+        # substring searches over the full source credit text
+        pending_pls = []
+        for elem in source_credit.iter():
+            tag = elem.tag
+            if tag == REF_TAG:
+                href = elem.get('href', '')
+                if '/pl/' in href:
+                    pl_match = RE_PL_PATH.search(href)
+                    if pl_match:
+                        pending_pls.append(f"{pl_match.group(1)}-{pl_match.group(2)}")
+            elif tag == DATE_TAG:
+                date_value = elem.get('date')
+                if date_value:
+                    for pl_num in pending_pls:
+                        source_dates.setdefault(pl_num, date_value)
+                    pending_pls.clear()
     
     # Now extract amendment info from notes
-    notes_section = section.find('.//uslm:notes', NAMESPACE)
+    if notes_section is None:
+        notes_section = find_first(XP_NOTES(section))
     if notes_section is not None:
         # Find amendment notes
-        amendment_notes = notes_section.findall('.//uslm:note[@topic="amendments"]', NAMESPACE)
+        amendment_notes = XP_AMEND_NOTES(notes_section)
         for note in amendment_notes:
             # Get all paragraph elements within the note
-            paragraphs = note.findall('.//uslm:p', NAMESPACE)
+            paragraphs = XP_P(note)
             for p in paragraphs:
                 p_text = ''.join(p.itertext())
                 
                 # Match pattern like "2022—Pub. L. 117–286..."
-                year_match = re.match(r'^(\d{4})—', p_text)
+                year_match = RE_AMENDMENT_YEAR.match(p_text)
                 if year_match:
                     amendment = {
                         'year': year_match.group(1),
@@ -281,7 +532,7 @@ def extract_amendment_history(section: ET.Element) -> List[Dict[str, str]]:
                     }
                     
                     # Extract Public Law
-                    pl_match = re.search(r'Pub\. L\. ([\d–-]+)', p_text)
+                    pl_match = RE_PL_LABEL.search(p_text)
                     if pl_match:
                         amendment['public_law'] = f"Pub. L. {pl_match.group(1)}"
                         # Try to find date from source_dates
@@ -290,7 +541,7 @@ def extract_amendment_history(section: ET.Element) -> List[Dict[str, str]]:
                             amendment['date'] = source_dates[pl_num]
                     
                     # Extract Statutes at Large
-                    stat_match = re.search(r'(\d+\s+Stat\.\s+\d+)', p_text)
+                    stat_match = RE_STAT_LABEL.search(p_text)
                     if stat_match:
                         amendment['statutes_at_large'] = stat_match.group(1)
                     
@@ -301,44 +552,46 @@ def extract_amendment_history(section: ET.Element) -> List[Dict[str, str]]:
 
 
 
-def extract_all_references(xml_element: ET.Element) -> Dict[str, Dict[str, List[str]]]:
+def extract_all_references(xml_element: ET.Element, refs: List[ET.Element] = None) -> Dict[str, Dict[str, List[str]]]:
     """
     Extract all types of references from any element, separating local from child references.
-    
+
     Args:
         xml_element: Any XML element
-        
+        refs: Pre-collected ref elements from scan_section (found if None)
+
     Returns:
         Dictionary with 'local_references' and 'child_references', each containing different types
     """
     def create_empty_refs():
         return {
             # From <ref> elements
-            'usc_references': [],          # USC section/chapter references
-            'act_references': [],          # Act references 
-            'public_law_hrefs': [],        # Public law from href
-            'statute_hrefs': [],           # Statutes from href
-            
+            'usc_references': set(),       # USC section/chapter references
+            'act_references': set(),       # Act references
+            'public_law_hrefs': set(),     # Public law from href
+            'statute_hrefs': set(),        # Statutes from href
+
             # From text patterns
-            'public_laws_text': [],        # Public law from text
-            'statutes_text': [],           # Statutes from text
-            'executive_orders': [],        # Executive orders (text only, no hrefs)
-            'federal_register': [],        # Federal Register citations
+            'public_laws_text': set(),     # Public law from text
+            'statutes_text': set(),        # Statutes from text
+            'executive_orders': set(),     # Executive orders (text only, no hrefs)
+            'federal_register': set(),     # Federal Register citations
         }
     
     local_refs = create_empty_refs()
     child_refs = create_empty_refs()
     
     # Process all ref elements in the document
-    for ref in xml_element.findall('.//uslm:ref', NAMESPACE):
+    if refs is None:
+        refs = XP_REF(xml_element)
+    for ref in refs:
         # Determine if this ref belongs to a hierarchical child
         parent = ref.getparent()
         belongs_to_hierarchical_child = False
         
         # Walk up the tree to see if any ancestor is a hierarchical child
         while parent is not None and parent != xml_element:
-            parent_tag = parent.tag.split('}')[-1] if '}' in parent.tag else parent.tag
-            if parent_tag in HIERARCHICAL_TAGS:
+            if parent.tag in HIERARCHICAL_CLARK_TAGS:
                 belongs_to_hierarchical_child = True
                 break
             parent = parent.getparent()
@@ -355,18 +608,19 @@ def extract_all_references(xml_element: ET.Element) -> Dict[str, Dict[str, List[
     
     # Extract text patterns from child content
     for child in xml_element:
-        child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        child_tag = local_name(child.tag)
         if child_tag in HIERARCHICAL_TAGS:
             child_text = ''.join(child.itertext())
             extract_text_patterns(child_text, child_refs)
     
-    # Remove duplicates
-    for refs in [local_refs, child_refs]:
-        for key in refs:
-            refs[key] = list(set(refs[key]))
-    
     # Check for text references without hrefs (only for local)
     check_text_only_refs(xml_element, local_refs)
+
+    # Sets deduplicate as they accumulate; convert once to sorted lists
+    # for deterministic JSON output
+    for refs_dict in [local_refs, child_refs]:
+        for key in refs_dict:
+            refs_dict[key] = sorted(refs_dict[key])
     
     return {
         'local_references': local_refs,
@@ -374,103 +628,147 @@ def extract_all_references(xml_element: ET.Element) -> Dict[str, Dict[str, List[
     }
 
 
+def parse_usc_href(href: str):
+    """
+    Parse a '/us/usc/t<title>/<s|c><num>' href with plain string scanning.
+
+    Hrefs are prefix-fixed, so startswith plus slicing beats the regex
+    engine in the hot ref loop. Returns (title, type_char, num) or None
+    for non-matching forms (callers fall back to the compiled regex).
+    """
+    if not href.startswith('/us/usc/t'):
+        return None
+    sep = href.find('/', 9)
+    if sep < 0:
+        return None
+    title = href[9:sep]
+    if not title or not title[0].isdigit():
+        return None
+    type_char = href[sep + 1:sep + 2]
+    if type_char not in ('s', 'c'):
+        return None
+    rest = href[sep + 2:]
+    # Number is leading digits plus optional trailing letters
+    i = 0
+    while i < len(rest) and rest[i].isdigit():
+        i += 1
+    if i == 0:
+        return None
+    j = i
+    while j < len(rest) and rest[j].isalpha():
+        j += 1
+    return title, type_char, rest[:j]
+
+
 def process_ref_element(ref: ET.Element, refs_dict: Dict[str, List[str]]) -> None:
     """Process a single ref element and add to appropriate reference list."""
     href = ref.get('href', '')
     if not href:
         return
-        
+
     # USC references: /us/usc/t5/s1202 or /us/usc/t5/ch12
-    usc_match = re.match(r'/us/usc/t(\d+[A-Za-z]*)/([sc])(\d+[A-Za-z]*)', href)
-    if usc_match:
-        title, type_char, num = usc_match.groups()
+    parsed = parse_usc_href(href)
+    if parsed is None and href.startswith('/us/usc/t'):
+        # Non-standard form; let the regex decide
+        usc_match = RE_USC_HREF.match(href)
+        parsed = usc_match.groups() if usc_match else None
+    if parsed:
+        title, type_char, num = parsed
         if type_char == 's':
             citation = f"{title} U.S.C. § {num}"
         else:  # chapter
             citation = f"{title} U.S.C. Ch. {num}"
-        refs_dict['usc_references'].append(citation)
+        refs_dict['usc_references'].add(citation)
         return
         
     # Act references: /us/act/1947-07-30/ch388
-    act_match = re.match(r'/us/act/([^/]+)/(.+)', href)
+    act_match = RE_ACT_HREF.match(href)
     if act_match:
         date, details = act_match.groups()
         act_ref = f"Act of {date}, {details}"
-        refs_dict['act_references'].append(act_ref)
+        refs_dict['act_references'].add(act_ref)
         return
         
     # Public law references: /us/pl/117/286
-    pl_match = re.match(r'/us/pl/(\d+)/(\d+)', href)
+    pl_match = RE_PL_HREF.match(href)
     if pl_match:
         congress, law_num = pl_match.groups()
         public_law = f"Pub. L. {congress}-{law_num}"
-        refs_dict['public_law_hrefs'].append(public_law)
+        refs_dict['public_law_hrefs'].add(public_law)
         return
         
     # Statute references: /us/stat/116/926
-    stat_match = re.match(r'/us/stat/(\d+[A-Za-z]*)/(\d+)', href)
+    stat_match = RE_STAT_HREF.match(href)
     if stat_match:
         volume, page = stat_match.groups()
         statute = f"{volume} Stat. {page}"
-        refs_dict['statute_hrefs'].append(statute)
+        refs_dict['statute_hrefs'].add(statute)
 
 
 def extract_local_text_only(xml_element: ET.Element) -> str:
     """Extract text from element excluding hierarchical child elements."""
     text_parts = []
-    
+
     # Add element's direct text
     if xml_element.text:
         text_parts.append(xml_element.text)
-    
-    # Process children but skip hierarchical ones
+
+    # Process children but skip hierarchical ones; itertext() is a C-level
+    # iterator, so feed its output straight into one flat list instead of
+    # materializing an intermediate string per child
     for child in xml_element:
-        child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-        
+        child_tag = local_name(child.tag)
+
         if child_tag not in HIERARCHICAL_TAGS:
             # Include this child's text
-            text_parts.append(''.join(child.itertext()))
-        
+            if text_parts:
+                text_parts.append(' ')
+            text_parts.extend(child.itertext())
+
         # Always include tail text
         if child.tail:
+            if text_parts:
+                text_parts.append(' ')
             text_parts.append(child.tail)
-    
-    return ' '.join(text_parts)
+
+    return ''.join(text_parts)
+
+
+_NOTE_SCAN_KEYS = {
+    'pl': 'public_laws_text',
+    'stat': 'statutes_text',
+    'eo': 'executive_orders',
+}
 
 
 def extract_text_patterns(text: str, refs_dict: Dict[str, List[str]]) -> None:
     """Extract reference patterns from text and add to refs_dict."""
-    # Public Laws in text: "Pub. L. 117-286"
-    pl_text_matches = re.findall(r'Pub\. L\. \d+[-–]\d+', text)
-    refs_dict['public_laws_text'].extend(pl_text_matches)
-    
-    # Statutes in text: "136 Stat. 4359"
-    stat_text_matches = re.findall(r'\d+ Stat\. \d+', text)
-    refs_dict['statutes_text'].extend(stat_text_matches)
-    
-    # Executive Orders: "Ex. Ord. No. 12107" or "Executive Order 13526"
-    eo_matches = re.findall(r'(?:Ex\. Ord\. No\.|Executive Order) \d+', text)
-    refs_dict['executive_orders'].extend(eo_matches)
-    
+    # Public Laws ("Pub. L. 117-286"), Statutes ("136 Stat. 4359"), and
+    # Executive Orders ("Ex. Ord. No. 12107" / "Executive Order 13526")
+    # in one pass over the text
+    for match in RE_NOTE_SCAN.finditer(text):
+        kind = match.lastgroup
+        refs_dict[_NOTE_SCAN_KEYS[kind]].add(match.group(kind))
+
     # Federal Register citations: "75 F.R. 707" or "75 F.R. 707, 1013"
-    fr_matches = re.findall(r'\d+ F\.R\. [\d,\s]+', text)
+    fr_matches = RE_FED_REGISTER.findall(text)
     # Clean up the matches (remove trailing commas/spaces)
     fr_matches = [match.rstrip(', ') for match in fr_matches]
-    refs_dict['federal_register'].extend(fr_matches)
+    refs_dict['federal_register'].update(fr_matches)
 
 
 def check_text_only_refs(xml_element: ET.Element, refs_dict: Dict[str, List[str]]) -> None:
     """Check if any text references don't have corresponding hrefs and warn."""
-    text_only_pls = set(refs_dict['public_laws_text']) - set(refs_dict['public_law_hrefs'])
-    text_only_stats = set(refs_dict['statutes_text']) - set(refs_dict['statute_hrefs'])
+    text_only_pls = refs_dict['public_laws_text'] - refs_dict['public_law_hrefs']
+    text_only_stats = refs_dict['statutes_text'] - refs_dict['statute_hrefs']
     
     if text_only_pls:
-        element_tag = xml_element.tag.split('}')[-1] if '}' in xml_element.tag else xml_element.tag
+        element_tag = local_name(xml_element.tag)
         element_id = xml_element.get('id', 'no-id')
         element_identifier = xml_element.get('identifier', 'no-identifier')
         pass  # Suppress warning
     if text_only_stats:
-        element_tag = xml_element.tag.split('}')[-1] if '}' in xml_element.tag else xml_element.tag
+        element_tag = local_name(xml_element.tag)
         element_id = xml_element.get('id', 'no-id')
         element_identifier = xml_element.get('identifier', 'no-identifier')
         pass  # Suppress warning
@@ -487,41 +785,41 @@ def extract_meta(doc: ET.Element) -> Dict[str, Any]:
         Dictionary containing all metadata fields
     """
     metadata = {}
-    meta_elem = doc.find('.//uslm:meta', NAMESPACE)
+    meta_elem = doc.find('./uslm:meta', NAMESPACE)
     
     if meta_elem is not None:
         # Extract Dublin Core metadata
-        dc_title = meta_elem.find('.//dc:title', NAMESPACE)
+        dc_title = meta_elem.find('./dc:title', NAMESPACE)
         if dc_title is not None and dc_title.text:
             metadata['dc:title'] = dc_title.text
             
-        dc_type = meta_elem.find('.//dc:type', NAMESPACE)
+        dc_type = meta_elem.find('./dc:type', NAMESPACE)
         if dc_type is not None and dc_type.text:
             metadata['dc:type'] = dc_type.text
             
-        dc_publisher = meta_elem.find('.//dc:publisher', NAMESPACE)
+        dc_publisher = meta_elem.find('./dc:publisher', NAMESPACE)
         if dc_publisher is not None and dc_publisher.text:
             metadata['dc:publisher'] = dc_publisher.text
             
-        dc_creator = meta_elem.find('.//dc:creator', NAMESPACE)
+        dc_creator = meta_elem.find('./dc:creator', NAMESPACE)
         if dc_creator is not None and dc_creator.text:
             metadata['dc:creator'] = dc_creator.text
             
-        dcterms_created = meta_elem.find('.//dcterms:created', NAMESPACE)
+        dcterms_created = meta_elem.find('./dcterms:created', NAMESPACE)
         if dcterms_created is not None and dcterms_created.text:
             metadata['dcterms:created'] = dcterms_created.text
             
         # Extract USLM-specific metadata
-        doc_number = meta_elem.find('.//uslm:docNumber', NAMESPACE)
+        doc_number = meta_elem.find('./uslm:docNumber', NAMESPACE)
         if doc_number is not None and doc_number.text:
             metadata['docNumber'] = doc_number.text
             
-        doc_pub_name = meta_elem.find('.//uslm:docPublicationName', NAMESPACE)
+        doc_pub_name = meta_elem.find('./uslm:docPublicationName', NAMESPACE)
         if doc_pub_name is not None and doc_pub_name.text:
             metadata['docPublicationName'] = doc_pub_name.text
             
         # Extract properties
-        properties = meta_elem.findall('.//uslm:property', NAMESPACE)
+        properties = meta_elem.findall('./uslm:property', NAMESPACE)
         for prop in properties:
             role = prop.get('role')
             if role and prop.text:
@@ -548,21 +846,76 @@ def extract_all_element_attributes(element: ET.Element) -> Dict[str, Any]:
 
 
 
-def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def extract_element_content(elem: ET.Element):
+    """
+    Extract element content preserving document order.
+
+    Runs a post-order DFS on an explicit stack rather than recursing, so a
+    subtree of N nodes costs one Python frame instead of N and deep
+    paragraph nesting cannot hit the recursion limit.
+
+    Args:
+        elem: XML element to extract
+
+    Returns:
+        Nested dict of attributes/text/children, the tail text for
+        otherwise-empty elements, or None when there is nothing to keep
+    """
+    # Each frame: [element, local tag, child iterator, collected children]
+    stack = [[elem, local_name(elem.tag), iter(elem), []]]
+    while True:
+        frame = stack[-1]
+        child = next(frame[2], None)
+        if child is not None:
+            stack.append([child, local_name(child.tag), iter(child), []])
+            continue
+
+        # All children assembled; build this element's result
+        el, tag, _, children_in_order = frame
+        result = {}
+        if el.attrib:
+            result['attributes'] = dict(el.attrib)
+        if el.text:
+            result['text'] = el.text
+        if children_in_order:
+            result['children_in_order'] = children_in_order
+            # For paragraphs with children, also capture the complete text
+            if tag == 'p':
+                full_text = ''.join(el.itertext())
+                if full_text:
+                    result['paragraph_text'] = full_text
+
+        # If element has no attributes, text, or children, fall back to tail
+        if not result:
+            result = el.tail if el.tail else None
+
+        stack.pop()
+        if not stack:
+            return result
+        if result:
+            stack[-1][3].append({'tag': tag, 'content': result})
+
+
+def build_dict(element_data: 'ElementData', filename: str, meta: Dict[str, Any],
+               is_positive_law: Any = None) -> Optional[Dict[str, Any]]:
     """
     Convert element data with ancestor paths to a comprehensive dictionary.
-    
+
     Args:
-        element_data: Element data with ancestor paths from traverse_with_ancestor_paths()
+        element_data: ElementData record from the traversal
         filename: Source filename (e.g., 'usc50A.xml')
         metadata: Document-level metadata dictionary
-        
+        is_positive_law: Per-file constant hoisted by the caller
+            (looked up from meta if None)
+
     Returns:
         Dictionary with law information or None if element should be skipped
     """
-    xml_element = element_data['xml_element']
-    element_info = element_data['element_info']
-    ancestor_path = element_data['ancestor_path']
+    if is_positive_law is None:
+        is_positive_law = meta.get('property[@role="is-positive-law"]')
+    xml_element = element_data.xml_element
+    element_info = element_data.element_info
+    ancestor_path = element_data.ancestor_path
     
     
     # Get element number and heading
@@ -572,8 +925,11 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
     
     
     
+    # Walk the subtree once, collecting everything the extractors need
+    refs, source_credit_elem, notes_elem = scan_section(xml_element)
+
     # Extract amendment history for all elements
-    amendment_history = extract_amendment_history(xml_element)
+    amendment_history = extract_amendment_history(xml_element, source_credit_elem, notes_elem)
     
     # Get element attributes
     element_attributes = element_info.get('attributes')
@@ -581,72 +937,28 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
         element_attributes = {}
     
     # Extract actual child elements that exist in the XML
-    def extract_element_content(elem):
-        """Recursively extract element content preserving document order"""
-        tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-        
-        # Get element attributes
-        attrs = dict(elem.attrib) if elem.attrib else {}
-        
-        # Get direct text content
-        text = elem.text if elem.text else ''
-        
-        # Get child elements in document order
-        children_in_order = []
-        for child in elem:
-            child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            child_content = extract_element_content(child)
-            if child_content:
-                children_in_order.append({
-                    'tag': child_tag,
-                    'content': child_content
-                })
-        
-        # Build result
-        result = {}
-        if attrs:
-            result['attributes'] = attrs
-        if text:
-            result['text'] = text
-        if children_in_order:
-            result['children_in_order'] = children_in_order
-            
-        # For elements with children, also capture the complete text content
-        if children_in_order and tag == 'p':
-            full_text = ''.join(elem.itertext())
-            if full_text:
-                result['paragraph_text'] = full_text
-        
-        # If element has no attributes, text, or children, return the tail text if any
-        if not result and elem.tail:
-            return elem.tail
-        
-        return result if result else None
-    
     child_elements = {}
     for child in xml_element:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        tag = local_name(child.tag)
         content = extract_element_content(child)
         if content:
             child_elements[tag] = content
     
-    # Build ancestors list from top to bottom (furthest to nearest)
-    ancestors = []
-    for ancestor in ancestor_path:
-        tag = ancestor['tag'].capitalize()
-        identifier = ancestor.get('attributes', {}).get('identifier', '')
-        if identifier:
-            ancestors.append(f"{tag}:{identifier}")
-    
-    
-    
-    
+    # Ancestors string is pre-joined incrementally during traversal
+    ancestors_joined = element_data.ancestors_joined
+
+    # Intern the small-cardinality strings repeated across every law in a
+    # title so they share one object instead of duplicating per dict
+    tag_interned = sys.intern(element_info['tag'])
+    status = element_attributes.get('status')
+    status_interned = sys.intern(status) if status else 'none'
+
     # Build computed fields
     computed_fields = {
-        "processing_timestamp": time.time(),
-        "processing_machine": socket.gethostname(),
-        "file_source": filename,
-        "ancestors": "; ".join(ancestors)
+        "processing_timestamp": PROCESSING_TIMESTAMP,
+        "processing_machine": PROCESSING_MACHINE,
+        "file_source": sys.intern(filename),
+        "ancestors": ancestors_joined
     }
     
     # Add amendment history to computed fields
@@ -662,8 +974,8 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
         child_pointers = own_content_data.pop('child_pointers', [])
         own_content_data.pop('num_children', None)  # Remove this too since it's redundant
 
-    # Extract all references
-    all_references = extract_all_references(xml_element)
+    # Extract all references from the pre-collected ref elements
+    all_references = extract_all_references(xml_element, refs)
 
     # Create list of child identifiers for elastic_dict
     child_identifiers = [child['identifier'] for child in child_pointers if child.get('identifier')]
@@ -671,13 +983,14 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
     # Build elastic_dict with fields chosen for final RAG dictionary metadata
     elastic_dict = {
         "guid": element_attributes.get('id', ''),  # Note: renamed from XML's @id attribute for clarity
-        "element_type": element_info['tag'],
+        "element_type": tag_interned,
         "num": element_info['num'],
         "num_numeric": ''.join(c for c in element_info['num'] if c.isdigit()),
         "heading": element_info['heading'],
         "identifier": element_attributes.get('identifier', ''),
-        "status": element_attributes.get('status') if element_attributes.get('status') else 'none',
-        "is_positive_law": meta['property[@role="is-positive-law"]'],
+        "text_hash": calculate_text_hash(own_content_data.get('text_local', '')),
+        "status": status_interned,
+        "is_positive_law": is_positive_law,
         "references": all_references['local_references'],  # Only local references in elastic_dict
         "child_identifiers": child_identifiers,  # Simple list of child identifiers
         "meta": meta,
@@ -686,7 +999,7 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
 
     return {
         # Element info
-        "tag": element_info['tag'],
+        "tag": tag_interned,
         "num": element_info['num'],
         "heading": element_info['heading'],
         "attributes": element_attributes,
@@ -715,6 +1028,101 @@ def build_dict(element_data: Dict[str, Any], filename: str, meta: Dict[str, Any]
 
 
 
+class LawView:
+    """
+    Lazy view over a hierarchical element's law dictionary.
+
+    Cheap identity fields (tag, num, heading, attributes) are served from
+    the traversal record; the full dictionary — amendment history,
+    references, notes and text extraction — is only built on first access
+    to any other key. Consumers that just scan headings never pay for the
+    heavy extraction.
+    """
+    __slots__ = ('_element_data', '_filename', '_meta', '_law')
+
+    _CHEAP_KEYS = ('tag', 'num', 'heading', 'attributes')
+
+    def __init__(self, element_data: 'ElementData', filename: str, meta: Dict[str, Any]):
+        self._element_data = element_data
+        self._filename = filename
+        self._meta = meta
+        self._law = None
+
+    def _materialize(self) -> Dict[str, Any]:
+        if self._law is None:
+            self._law = build_dict(self._element_data, self._filename, self._meta)
+        return self._law
+
+    def __getitem__(self, key):
+        if self._law is None and key in self._CHEAP_KEYS:
+            return self._element_data.element_info[key] if key != 'attributes' \
+                else self._element_data.element_info['attributes']
+        return self._materialize()[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._materialize().keys()
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __contains__(self, key):
+        return key in self._materialize()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fully built law dictionary."""
+        return self._materialize()
+
+
+def collect_toc_right_col(elem: ET.Element, text_parts: List[str],
+                          footnotes: List[str]) -> None:
+    """
+    Collect a TOC right column's text and footnotes in one iterative walk.
+
+    Inline footnote refs become bracketed markers, footnote notes are
+    pruned from the text and gathered separately, and tail text is kept
+    in document order. An explicit work stack replaces the recursion the
+    generic-element branch previously required.
+    """
+    if elem.text:
+        text_parts.append(elem.text)
+    # Each child is handled ('proc') and then, after any subtree, its tail
+    # is emitted ('tail'); LIFO order keeps this matching document order
+    work = []
+    for child in reversed(elem):
+        work.append(('tail', child))
+        work.append(('proc', child))
+    while work:
+        kind, child = work.pop()
+        if kind == 'tail':
+            if child.tail:
+                text_parts.append(child.tail)
+            continue
+
+        child_tag = local_name(child.tag)
+        if child_tag == 'ref' and 'footnoteRef' in child.get('class', ''):
+            # Add inline reference
+            if child.text:
+                text_parts.append(f"[{child.text}]")
+        elif child_tag == 'note' and child.get('type') == 'footnote':
+            # Collect footnote for bottom section; subtree stays pruned
+            footnote_text = ''.join(child.itertext())
+            if footnote_text:
+                footnotes.append(footnote_text)
+        else:
+            # Descend into other elements
+            if child.text:
+                text_parts.append(child.text)
+            for grandchild in reversed(child):
+                work.append(('tail', grandchild))
+                work.append(('proc', grandchild))
+
+
 def parse_toc(toc_element: ET.Element) -> str:
     """
     Parse table of contents with footnote references inline and all footnotes at bottom.
@@ -723,14 +1131,14 @@ def parse_toc(toc_element: ET.Element) -> str:
     all_footnotes = []
     
     # Check for header (like "Sec.")
-    header = toc_element.find('.//uslm:header[@role="tocColumnHeader"]', NAMESPACE)
+    header = find_first(XP_TOC_HEADER(toc_element))
     header_text = ""
     if header is not None:
         header_text = ''.join(header.itertext())
-    
-    for item in toc_element.findall('.//uslm:tocItem', NAMESPACE):
-        left_col = item.find('.//uslm:column[@class="twoColumnLeft"]', NAMESPACE)  
-        right_col = item.find('.//uslm:column[@class="twoColumnRight"]', NAMESPACE)
+
+    for item in XP_TOC_ITEM(toc_element):
+        left_col = find_first(XP_COL_LEFT(item))
+        right_col = find_first(XP_COL_RIGHT(item))
         
         if left_col is not None and right_col is not None:
             left_text = ''.join(left_col.itertext())
@@ -738,31 +1146,7 @@ def parse_toc(toc_element: ET.Element) -> str:
             # Process right column: collect text with references, collect footnotes
             right_text_parts = []
             footnotes_in_this_item = []
-            
-            def process_right_col(elem):
-                if elem.text:
-                    right_text_parts.append(elem.text)
-                
-                for child in elem:
-                    child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                    
-                    if child_tag == 'ref' and 'footnoteRef' in child.get('class', ''):
-                        # Add inline reference
-                        if child.text:
-                            right_text_parts.append(f"[{child.text}]")
-                    elif child_tag == 'note' and child.get('type') == 'footnote':
-                        # Collect footnote for bottom section
-                        footnote_text = ''.join(child.itertext())
-                        if footnote_text:
-                            footnotes_in_this_item.append(footnote_text)
-                    else:
-                        # Recursively process other elements
-                        process_right_col(child)
-                    
-                    if child.tail:
-                        right_text_parts.append(child.tail)
-            
-            process_right_col(right_col)
+            collect_toc_right_col(right_col, right_text_parts, footnotes_in_this_item)
             right_text = ' '.join(right_text_parts)
             
             # Add this line to TOC
@@ -772,19 +1156,16 @@ def parse_toc(toc_element: ET.Element) -> str:
             # Add footnotes to master list
             all_footnotes.extend(footnotes_in_this_item)
     
-    # Build final TOC
+    # Build final TOC with one join; the footnote block rides in the same
+    # list instead of concatenating a second copy of the whole TOC text
     toc_parts = ["Table of Contents:"]
     if header_text:
         toc_parts.append(header_text)
     toc_parts.extend(lines)
-    toc_text = "\n".join(toc_parts)
-    
-    # Add all footnotes at bottom
     if all_footnotes:
-        footnote_section = "\n\nFootnotes:\n" + "\n".join(all_footnotes)
-        return toc_text + footnote_section
-    else:
-        return toc_text
+        toc_parts.append("\nFootnotes:")
+        toc_parts.extend(all_footnotes)
+    return "\n".join(toc_parts)
 
 
 def extract_table(table_elem: ET.Element) -> str:
@@ -865,7 +1246,7 @@ def extract_notes(notes_elem: ET.Element) -> List[Dict[str, Any]]:
         
         # Process child elements
         for child in note:
-            child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            child_tag = local_name(child.tag)
             
             if child_tag == 'table':
                 # Extract table with formatting
@@ -912,22 +1293,43 @@ def extract_own_content_text(xml_element: ET.Element) -> Dict[str, Any]:
         Dictionary with own_content_text, child_pointers, sourceCredit, etc.
     """
     
+    # Fast path for leaf-like elements (the vast majority of sections):
+    # assume only simple text children and bail to the full tag dispatch
+    # below on the first complex child, so simple sections are walked once
+    text_parts = []
+    for child in xml_element:
+        child_tag = local_name(child.tag)
+        if child_tag not in SIMPLE_CONTENT_TAGS:
+            break
+        child_text = ''.join(child.itertext())
+        if child_tag == 'p':
+            child_text = child_text.strip()
+        if child_text:
+            text_parts.append(child_text)
+    else:
+        text_local = '\n\n'.join(text_parts)
+        return {
+            "text_local": text_local,
+            "text_local_length": len(text_local),
+            "child_pointers": [],
+            "num_children": 0,
+            "sourceCredit": '',
+            "notes": []
+        }
+
     own_content_parts = []
     child_pointers = []
     source_credit_text = ''
     notes_dict = []
-    
+
     # Process all child elements
     for child in xml_element:
-        child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        child_tag = local_name(child.tag)
         
         # Major structural elements - just create pointers
         if child_tag in HIERARCHICAL_TAGS:
-            child_num_elem = child.find('./uslm:num', NAMESPACE)
-            child_num = child_num_elem.text if child_num_elem is not None and child_num_elem.text else ''
+            child_num, child_heading = find_num_heading_text(child)
             child_identifier = child.get('identifier', '')
-            child_heading_elem = child.find('./uslm:heading', NAMESPACE)
-            child_heading = child_heading_elem.text if child_heading_elem is not None and child_heading_elem.text else ''
             
             child_pointers.append({
                 'tag': child_tag,
@@ -986,45 +1388,253 @@ def extract_own_content_text(xml_element: ET.Element) -> Dict[str, Any]:
 
 
 
-def parse_single_title(filepath: str) -> List[Dict[str, Any]]:
+def iter_sections(filepath: str):
     """
-    Parse a single USC title file and extract all laws using ancestor path traversal.
-    
+    Stream <section> elements from a title file without keeping the whole tree.
+
+    Uses iterparse so peak memory is proportional to one section rather than
+    the full file. Each yielded element is freed after the next iteration, so
+    consumers must finish with a section before advancing. Note that ancestor
+    context is discarded; use parse_single_title() when hierarchy is needed.
+
     Args:
         filepath: Path to the XML file
-        
+
+    Yields:
+        Section XML elements in document order
+    """
+    # Tag filtering happens at the C level; huge_tree handles the
+    # largest titles (e.g. Title 42)
+    context = ET.iterparse(filepath, events=('end',), tag=SECTION_TAG, huge_tree=True)
+    for _, elem in context:
+        yield elem
+        # Free the section and any already-parsed preceding siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    del context
+
+
+def scan_status_counts(filepath: str) -> Counter:
+    """
+    Count section status values without building a tree.
+
+    Drives the raw expat parser directly, so a summary pass touches each
+    byte once and never allocates elements or law dictionaries. Useful
+    for smoke tests and quick corpus health checks via --summary-only.
+
+    Args:
+        filepath: Path to the XML file
+
     Returns:
-        List of law dictionaries
+        Counter mapping status value to number of sections
+    """
+    from xml.parsers import expat
+
+    counts = Counter()
+
+    def start_element(name, attrs):
+        # The USC files use a default namespace, so expat reports the
+        # bare local name here
+        if name == 'section':
+            counts[attrs.get('status', 'none')] += 1
+
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    with open(filepath, 'rb') as f:
+        parser.ParseFile(f)
+    return counts
+
+
+def parse_single_title_iter(filepath: str, lazy: bool = False):
+    """
+    Parse a single USC title file, yielding law dictionaries one at a time.
+
+    Avoids materializing the full list of laws, so callers that stream
+    results to disk never hold the whole title in memory.
+
+    Args:
+        filepath: Path to the XML file
+        lazy: If True, yield LawView objects that defer the heavy
+            per-element extraction until a non-trivial field is accessed
+
+    Yields:
+        Law dictionaries (or LawView objects when lazy=True)
     """
-    laws = []
     filename = os.path.basename(filepath)
-    
-    # Parse the file
-    tree = ET.parse(filepath)
+
+    # Parse from a memory map, reusing the shared parser. The kernel pages
+    # the file in on demand and lxml reads from the mapping like a file
+    # object, which avoids stdio read syscalls on the 100MB+ titles
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        tree = ET.parse(mm, XML_PARSER)
     doc = tree.getroot()
-    
+
     # Extract meta from the document
     meta = extract_meta(doc)
-    
-    # Get all elements with their complete ancestor paths
-    elements_with_paths = traverse_with_ancestor_paths(doc)
-    
-    # Convert each element+path to a law dictionary
-    for element_data in elements_with_paths:
-        # Only process hierarchical elements
-        if element_data['element_info']['tag'] in HIERARCHICAL_TAGS:
-            law_dict = build_dict(
-                element_data=element_data,
-                filename=filename,
-                meta=meta
-            )
-            if law_dict:
-                laws.append(law_dict)
-    
-    return laws
 
+    # Per-file constant; hoisted so the per-element path skips the lookup
+    is_positive_law = meta.get('property[@role="is-positive-law"]')
+
+    # Bind the hot-loop callables to locals (LOAD_FAST instead of a
+    # global lookup per element)
+    build = build_dict
+    view = LawView
+
+    # Traverse lazily, building element data only for hierarchical elements
+    for element_data in iter_with_ancestor_paths(doc, hierarchical_only=True):
+        if lazy:
+            yield view(element_data, filename, meta)
+            continue
+        law_dict = build(element_data, filename, meta, is_positive_law)
+        if law_dict:
+            yield law_dict
 
 
+def parse_single_title(filepath: str) -> List[Dict[str, Any]]:
+    """
+    Parse a single USC title file and extract all laws using ancestor path traversal.
+
+    Args:
+        filepath: Path to the XML file
+
+    Returns:
+        List of law dictionaries
+    """
+    return list(parse_single_title_iter(filepath))
+
+
+def dumps_law_bytes(law: Dict[str, Any], pretty: bool = False) -> bytes:
+    """
+    Serialize a law dictionary to JSON bytes.
+
+    Uses orjson when installed (SIMD string escaping, several times faster
+    than stdlib json on these nested dicts), falling back to json otherwise.
+    Output is compact unless pretty is set; indentation roughly doubles
+    encode time and grows the files ~40%.
+
+    Args:
+        law: Law dictionary to serialize
+        pretty: If True, indent the output for human readers
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(law, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(law, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(law, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_laws_json(laws_iter, output_file: str, pretty: bool = False) -> int:
+    """
+    Stream an iterable of law dictionaries to a JSON array on disk.
+
+    Serializes one law at a time so the full list and its JSON text are
+    never both held in memory.
+
+    Args:
+        laws_iter: Iterable of law dictionaries
+        output_file: Path to the output JSON file
+        pretty: If True, indent each law for human readers
+
+    Returns:
+        Number of laws written
+    """
+    count = 0
+    # Binary mode with a large buffer skips the text-codec layer and
+    # issues one write(2) per buffer instead of per chunk
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(b'[')
+        for law in laws_iter:
+            if count:
+                f.write(b',\n')
+            f.write(dumps_law_bytes(law, pretty))
+            count += 1
+        f.write(b']')
+    return count
+
+
+
+
+def write_laws_jsonl(laws_iter, output_file: str) -> int:
+    """
+    Stream an iterable of law dictionaries to a JSON Lines file.
+
+    One compact JSON object per line — no outer array, so outputs from
+    parallel workers can be concatenated trivially.
+
+    Args:
+        laws_iter: Iterable of law dictionaries
+        output_file: Path to the output .jsonl file
+
+    Returns:
+        Number of laws written
+    """
+    count = 0
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        for law in laws_iter:
+            if orjson is not None:
+                f.write(orjson.dumps(law))
+            else:
+                f.write(json.dumps(law, ensure_ascii=False).encode('utf-8'))
+            f.write(b'\n')
+            count += 1
+    return count
+
+
+def output_is_fresh(filepath: str, output_file: str) -> bool:
+    """
+    Check whether an existing output file is newer than its source XML.
+
+    Args:
+        filepath: Path to the source XML file
+        output_file: Path to the generated JSON file
+
+    Returns:
+        True if output_file exists, is non-empty, and postdates filepath
+    """
+    try:
+        out_stat = os.stat(output_file)
+    except OSError:
+        return False
+    return out_stat.st_size > 0 and out_stat.st_mtime >= os.path.getmtime(filepath)
+
+
+def parse_title_to_json(filepath: str, output_dir: str, jsonl: bool = False,
+                        skip_fresh: bool = False, pretty: bool = False):
+    """
+    Parse one title file and stream it to a JSON file in output_dir.
+
+    Module-level so it is picklable as a process-pool worker.
+
+    Args:
+        filepath: Path to the XML file
+        output_dir: Directory for the output JSON file
+        jsonl: If True, write JSON Lines instead of a JSON array
+        skip_fresh: If True, skip parsing when the output file is already
+            newer than the XML (make-style incremental runs)
+        pretty: If True, indent JSON array output (ignored for JSON Lines)
+
+    Returns:
+        Tuple of (xml filename, element count, output file path);
+        the count is None when the title was skipped as up to date
+    """
+    xml_file = os.path.basename(filepath)
+    base = xml_file.replace('.xml', '')
+    ext = 'jsonl' if jsonl else 'json'
+    output_file = os.path.join(output_dir, f"{base}.{ext}")
+    if skip_fresh and output_is_fresh(filepath, output_file):
+        return xml_file, None, output_file
+    if jsonl:
+        count = write_laws_jsonl(parse_single_title_iter(filepath), output_file)
+    else:
+        count = write_laws_json(parse_single_title_iter(filepath), output_file,
+                                pretty)
+    return xml_file, count, output_file
+
 
 def main():
     """Main function for command line interface."""
@@ -1053,16 +1663,40 @@ def main():
         action='store_true',
         help='Parse all titles '
     )
-    
+    parser.add_argument(
+        '--jsonl',
+        action='store_true',
+        help='Write JSON Lines (one law per line) instead of JSON arrays'
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent JSON output for human readers (slower, larger files)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip titles whose output file is already newer than the XML'
+    )
+    parser.add_argument(
+        '--summary-only',
+        action='store_true',
+        help='Only print section status counts (fast scan, no JSON output)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help='Number of worker processes for --all (default: CPU count - 1)'
+    )
+
     args = parser.parse_args()
     
     # Check if XML data exists, offer to download if not
     ensure_xml_data_exists(args.xml_dir)
     
-    # Create output directory if it doesn't exist
-    if not args.output and not os.path.exists(args.output_dir):
-        os.makedirs(args.output_dir)
-        print(f"Created output directory: {args.output_dir}")
+    # Create output directory if it doesn't exist (race-free across workers)
+    os.makedirs(args.output_dir, exist_ok=True)
     
     if args.title:
         # Parse specific title
@@ -1074,34 +1708,79 @@ def main():
             print(f"Error: File {filepath} not found")
             return
         
+        if args.summary_only:
+            counts = scan_status_counts(filepath)
+            print(f"Status counts for Title {title_num}:")
+            for status, count in counts.most_common():
+                print(f"  {status}: {count}")
+            print(f"Total sections: {sum(counts.values())}")
+            return
+
         print(f"Parsing Title {title_num} from {filename}...")
-        laws = parse_single_title(filepath)
-        print(f"Found {len(laws)} elements in Title {title_num}")
-        
-        output_file = os.path.join(args.output_dir, f"{args.title}.json")
-        with open(output_file, 'w') as f:
-            json.dump(laws, f, indent=2, ensure_ascii=False)
+        if args.jsonl:
+            output_file = os.path.join(args.output_dir, f"{args.title}.jsonl")
+            count = write_laws_jsonl(parse_single_title_iter(filepath), output_file)
+        else:
+            output_file = os.path.join(args.output_dir, f"{args.title}.json")
+            count = write_laws_json(parse_single_title_iter(filepath), output_file,
+                                    args.pretty)
+        print(f"Found {count} elements in Title {title_num}")
         print(f"Saved to {output_file}")
         
     elif args.all:
         # Parse all titles
         print("Parsing all USC titles...")
-        xml_files = [f for f in os.listdir(args.xml_dir) if f.endswith('.xml') and f.startswith('usc')]
-        xml_files.sort()
+        # One scandir pass: the regex validates the name and extracts the
+        # title number, and the cached dirent stat supplies the size
+        entries = []
+        with os.scandir(args.xml_dir) as it:
+            for entry in it:
+                match = RE_TITLE_FILE.match(entry.name)
+                if match and entry.is_file():
+                    entries.append((entry.stat().st_size, int(match.group(1)), entry.name))
+
+        # Submit largest files first so a giant title (26, 42) starts early
+        # instead of straggling while other workers sit idle; ties break by
+        # title number for deterministic ordering
+        entries.sort(key=lambda e: (-e[0], e[1]))
+        xml_files = [name for _, _, name in entries]
         
+        # Titles are independent, so farm one file out per worker process
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        if args.summary_only:
+            total_counts = Counter()
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                futures = {
+                    pool.submit(scan_status_counts,
+                                os.path.join(args.xml_dir, xml_file)): xml_file
+                    for xml_file in xml_files
+                }
+                for future in as_completed(futures):
+                    total_counts.update(future.result())
+            print("Status counts across all titles:")
+            for status, count in total_counts.most_common():
+                print(f"  {status}: {count}")
+            print(f"Total sections: {sum(total_counts.values())}")
+            return
+
         total_elements = 0
-        for xml_file in xml_files:
-            filepath = os.path.join(args.xml_dir, xml_file)
-            print(f"\nParsing {xml_file}...")
-            laws = parse_single_title(filepath)
-            print(f"Found {len(laws)} elements")
-            total_elements += len(laws)
-            
-            # Save each title to its own file
-            output_file = os.path.join(args.output_dir, f"{xml_file.replace('.xml', '')}.json")
-            with open(output_file, 'w') as f:
-                json.dump(laws, f, indent=2, ensure_ascii=False)
-            print(f"Saved to {output_file}")
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {
+                pool.submit(parse_title_to_json, os.path.join(args.xml_dir, xml_file),
+                            args.output_dir, args.jsonl, args.incremental,
+                            args.pretty): xml_file
+                for xml_file in xml_files
+            }
+            for future in as_completed(futures):
+                xml_file, count, output_file = future.result()
+                # One write per completed title: workers stay silent, so the
+                # parent owns stdout and lines never interleave
+                if count is None:
+                    sys.stdout.write(f"Skipped {xml_file}: {output_file} is up to date\n")
+                else:
+                    total_elements += count
+                    sys.stdout.write(f"Parsed {xml_file}: {count} elements -> {output_file}\n")
         
         print(f"\nTotal elements parsed: {total_elements}")
         
@@ -1109,66 +1788,135 @@ def main():
         parser.error("Please specify either --title or --all")
 
 
-def filter_elements(elements: List[Dict[str, Any]], element_type: str = None, element_num: str = None) -> List[Dict[str, Any]]:
+def filter_elements(elements: List[Dict[str, Any]], element_type: str = None, element_num: str = None,
+                    verbose: bool = True) -> List[Dict[str, Any]]:
     """
     Filter elements by type and/or number.
-    
+
     Args:
         elements: List of element dictionaries
         element_type: Element type to filter by (e.g., 'section', 'chapter')
         element_num: Element number to filter by (e.g., '552', '5')
-        
+        verbose: If True, print a summary of each filter applied
+
     Returns:
         Filtered list of elements
     """
-    filtered = elements
-    
+    # Tags are interned on extraction, so an interned needle makes the
+    # equality below a pointer compare on every match
     if element_type:
-        filtered = [elem for elem in filtered if elem['tag'] == element_type]
-        print(f"Filtered to {len(filtered)} {element_type} elements")
-    
-    if element_num:
-        def num_equals(elem, search_num):
-            return elem['elastic_dict']['num_numeric'] == search_num
-        
-        filtered = [elem for elem in filtered if num_equals(elem, element_num)]
-        print(f"Filtered to {len(filtered)} elements with num equal to '{element_num}'")
-    
+        element_type = sys.intern(element_type)
+
+    if element_type and element_num:
+        # Fuse both predicates into a single pass over the list
+        filtered = [
+            elem for elem in elements
+            if elem['tag'] == element_type
+            and elem['elastic_dict']['num_numeric'] == element_num
+        ]
+        if verbose:
+            print(f"Filtered to {len(filtered)} {element_type} elements with num equal to '{element_num}'")
+    elif element_type:
+        filtered = [elem for elem in elements if elem['tag'] == element_type]
+        if verbose:
+            print(f"Filtered to {len(filtered)} {element_type} elements")
+    elif element_num:
+        filtered = [elem for elem in elements if elem['elastic_dict']['num_numeric'] == element_num]
+        if verbose:
+            print(f"Filtered to {len(filtered)} elements with num equal to '{element_num}'")
+    else:
+        filtered = elements
+
     return filtered
 
 
+def build_type_index(elements: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Build a tag -> elements index so repeated queries avoid full scans.
+
+    Args:
+        elements: List of element dictionaries
+
+    Returns:
+        Dictionary mapping element type to the list of matching elements
+    """
+    by_type = {}
+    for elem in elements:
+        by_type.setdefault(elem['tag'], []).append(elem)
+    return by_type
+
+
+def pretty_json(obj: Any) -> str:
+    """
+    Render an object as indented JSON for display, preferring orjson.
+
+    orjson uses two-space indentation; the stdlib fallback matches it so
+    display output is consistent either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def format_dict(element: Dict[str, Any], elastic_only: bool = False) -> str:
+    """
+    Format a single element dictionary as a display string.
+
+    Args:
+        element: Element dictionary to format
+        elastic_only: If True, only format elastic_dict portion
+
+    Returns:
+        Formatted string representation of the element
+    """
+    if not elastic_only:
+        return pretty_json(element)
+
+    parts = []
+    elastic = element['elastic_dict']
+    for key, value in elastic.items():
+        parts.append(f"\n----------------------{key}---------------------")
+        if key == 'notes' and isinstance(value, dict):
+            # Special handling for notes to show nested structure
+            for note_type, note_content in value.items():
+                parts.append(f"\n{note_type}:")
+                if isinstance(note_content, dict):
+                    if 'content' in note_content:
+                        parts.append(note_content['content'])
+                elif isinstance(note_content, list):
+                    for item in note_content:
+                        if isinstance(item, dict) and 'content' in item:
+                            parts.append(item['content'])
+                else:
+                    parts.append(str(note_content))
+        elif isinstance(value, dict):
+            # For other dict values, format as JSON
+            parts.append(pretty_json(value))
+        else:
+            parts.append(str(value))
+    return '\n'.join(parts)
+
+
 def print_dict(element: Dict[str, Any], elastic_only: bool = False) -> None:
     """
     Print a single element dictionary.
-    
+
     Args:
         element: Element dictionary to print
         elastic_only: If True, only print elastic_dict portion
     """
     if elastic_only:
-        elastic = element['elastic_dict']
-        for key, value in elastic.items():
-            print(f"\n----------------------{key}---------------------")
-            if key == 'notes' and isinstance(value, dict):
-                # Special handling for notes to show nested structure
-                for note_type, note_content in value.items():
-                    print(f"\n{note_type}:")
-                    if isinstance(note_content, dict):
-                        if 'content' in note_content:
-                            print(note_content['content'])
-                    elif isinstance(note_content, list):
-                        for item in note_content:
-                            if isinstance(item, dict) and 'content' in item:
-                                print(item['content'])
-                    else:
-                        print(note_content)
-            elif isinstance(value, dict):
-                # For other dict values, print as JSON
-                print(json.dumps(value, indent=2, ensure_ascii=False))
-            else:
-                print(value)
+        print(format_dict(element, elastic_only=True))
+    elif orjson is not None:
+        # orjson renders the whole dict several times faster than the
+        # stdlib encoder can stream it
+        sys.stdout.write(pretty_json(element))
+        sys.stdout.write('\n')
     else:
-        print(json.dumps(element, indent=4, ensure_ascii=False))
+        # Stream the encoder straight to stdout instead of building one
+        # huge string first; large sections allocate far less this way
+        json.dump(element, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
 
 
 if __name__ == "__main__":
@@ -1183,20 +1931,52 @@ if __name__ == "__main__":
     parser.add_argument('--num', help='Filter by exact element number (e.g., 1, 10, 1201)')
     parser.add_argument('--elastic-only', action='store_true', help='Only display elastic_dict portion of results')
     parser.add_argument('--int', action='store_true', help='Interactive mode - query sections interactively')
+    parser.add_argument('--cache', action='store_true',
+                        help='Cache parsed elements beside the XML (mtime-checked pickle)')
+    parser.add_argument('--summary', action='store_true',
+                        help='Print the status breakdown (full pass over all elements)')
     
     args = parser.parse_args()
     
     # Build filepath
-    filepath = f"{args.xml_dir}/{args.title}.xml"
-    
-    print(f"Parsing {filepath}...")
-    elements = parse_single_title(filepath)
+    filepath = os.path.join(args.xml_dir, f"{args.title}.xml")
+    
+    # With --cache, repeated runs load a pickle side-car instead of
+    # re-parsing the XML; output_is_fresh guards staleness by mtime
+    elements = None
+    cache_path = f"{filepath}.cache.pkl"
+    if args.cache and output_is_fresh(filepath, cache_path):
+        print(f"Loading cached parse of {filepath}...")
+        with open(cache_path, 'rb') as f:
+            elements = pickle.load(f)
+    if elements is None:
+        print(f"Parsing {filepath}...")
+        elements = parse_single_title(filepath)
+        if args.cache:
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(elements, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
     print(f"Found {len(elements)} elements")
+
+    # Tally only when asked: it is a full pass over the element list that
+    # preview runs do not need
+    if args.summary:
+        # Counter consuming chained itemgetter maps keeps the whole tally
+        # in C; no per-element bytecode runs in the loop
+        from operator import itemgetter
+        status_counts = Counter(
+            map(itemgetter('status'), map(itemgetter('elastic_dict'), elements)))
+        print("Status breakdown: " + ', '.join(
+            f"{status}: {count}" for status, count in status_counts.most_common()))
     
     # Interactive mode
     if args.int:
         print("\nInteractive mode. Examples: sec 552, ch 5, q to quit")
-        
+
+        # Index elements by type once so each query is a lookup, not a scan
+        type_index = build_type_index(elements)
+
         while True:
             query = input("\nQuery> ").strip().lower()
             if query == 'q' or query == 'quit':
@@ -1226,9 +2006,11 @@ if __name__ == "__main__":
             if query_type in type_map:
                 query_type = type_map[query_type]
             
-            # Filter and display
-            filtered = filter_elements(elements, element_type=query_type, element_num=query_num)
-            
+            # Filter and display using the prebuilt index
+            candidates = type_index.get(query_type, [])
+            filtered = [elem for elem in candidates
+                        if elem['elastic_dict']['num_numeric'] == query_num]
+
             if not filtered:
                 print(f"No matches found")
             else:
@@ -1244,16 +2026,17 @@ if __name__ == "__main__":
         # Save to JSON if requested
         if args.output_dir:
             output_file = os.path.join(args.output_dir, f"{args.title}.json")
-            with open(output_file, 'w') as f:
-                json.dump(filtered_elements, f, indent=2, ensure_ascii=False)
+            # Same orjson-backed streaming writer as the main CLI path
+            write_laws_json(filtered_elements, output_file)
             print(f"\nSaved {len(filtered_elements)} elements to {output_file}")
         else:
-            # Show filtered results with pretty printing
+            # Show filtered results with pretty printing, batched into one write
             display_elements = filtered_elements[:10]  # Show up to 10 results
-            print(f"\nShowing first {len(display_elements)} results:")
+            buf = [f"\nShowing first {len(display_elements)} results:"]
             for i, elem in enumerate(display_elements):
-                print(f"\n{i+1}. Element:")
-                print_dict(elem, elastic_only=args.elastic_only)
-            
+                buf.append(f"\n{i+1}. Element:")
+                buf.append(format_dict(elem, elastic_only=args.elastic_only))
+
             if len(filtered_elements) > 10:
-                print(f"\n... and {len(filtered_elements) - 10} more results")
\ No newline at end of file
+                buf.append(f"\n... and {len(filtered_elements) - 10} more results")
+            sys.stdout.write('\n'.join(buf) + '\n')
\ No newline at end of file